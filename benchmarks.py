@@ -0,0 +1,276 @@
+"""
+Benchmark suite for the hot paths of dna.py, polynomial.py and health_profile.py.
+
+Usage:
+    python benchmarks.py --scale small --output results.json
+    python benchmarks.py --scale small --baseline results.json --threshold 0.10
+
+Every benchmark runs on synthetic data generated from a fixed seed, so results are reproducible
+and need no network access or input files. Results are written as JSON; when a baseline file is
+given, any benchmark slower than the baseline by more than the threshold, or present in the
+baseline but not run, is reported and the process exits with status 1.
+
+Each benchmark calls its function at least repeat + 1 times, so the large scale takes tens of
+minutes; use --only and --repeat 1 to run parts of it.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+
+from dna import DNASequence, RNASequence
+from health_profile import HealthProfile
+from polynomial import Polynomial
+
+SEED = 2024
+
+# Problem sizes per scale: sequence length in bases, polynomial degree and cohort size.
+# Polynomial.__mul__ is quadratic and would take hours per call at degree 1e6, so it has
+# its own size, capped at degree 1e4 for the "large" scale.
+SCALES = {
+    'small': {'dna': 1_000, 'polynomial': 10, 'polynomial_mul': 10, 'health': 1_000},
+    'medium': {'dna': 1_000_000, 'polynomial': 1_000, 'polynomial_mul': 1_000, 'health': 100_000},
+    'large': {'dna': 100_000_000, 'polynomial': 1_000_000, 'polynomial_mul': 10_000, 'health': 10_000_000},
+}
+
+
+def generate_dna(length, seed=SEED):
+    """
+    Generates a random DNA sequence.
+
+    Parameters:
+        length (int): Number of bases.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        DNASequence: A DNASequence over {'A', 'T', 'C', 'G'}.
+    """
+    rng = random.Random(seed)
+    return DNASequence('bench', ''.join(rng.choices('ATCG', k=length)), {'A', 'T', 'C', 'G'})
+
+
+def generate_rna(length, seed=SEED):
+    """
+    Generates a random RNA sequence without stop codons, truncated to a whole number of codons.
+
+    Parameters:
+        length (int): Number of bases (rounded down to a multiple of 3).
+        seed (int): Seed for the random generator.
+
+    Returns:
+        RNASequence: An RNASequence over {'A', 'U', 'C', 'G'}.
+    """
+    rng = random.Random(seed)
+    codons = [a + b + c for a in 'AUCG' for b in 'AUCG' for c in 'AUCG']
+    codons = [codon for codon in codons if codon not in ('UAA', 'UAG', 'UGA')]
+    return RNASequence('bench', ''.join(rng.choices(codons, k=length // 3)), RNASequence.valid_chars)
+
+
+def generate_polynomial(degree, seed=SEED):
+    """
+    Generates a random polynomial with integer coefficients and a non-zero leading term.
+
+    Parameters:
+        degree (int): Degree of the polynomial.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        Polynomial: A Polynomial of the requested degree.
+    """
+    rng = random.Random(seed)
+    coefficients = [rng.randint(-100, 100) for _ in range(degree + 1)]
+    coefficients[0] = coefficients[0] or 1
+    coefficients[-1] = coefficients[-1] or 1
+    return Polynomial(coefficients)
+
+
+def generate_profiles(count, seed=SEED):
+    """
+    Generates a cohort of random health profiles.
+
+    Parameters:
+        count (int): Number of profiles.
+        seed (int): Seed for the random generator.
+
+    Returns:
+        list: A list of HealthProfile instances.
+    """
+    rng = random.Random(seed)
+    return [HealthProfile('bench', rng.randint(1930, 2010), rng.uniform(150, 200), rng.uniform(45, 120))
+            for _ in range(count)]
+
+
+def _bench_find_motif(size):
+    """Prepares DNASequence.find_motif on a sequence of the given length."""
+    sequence = generate_dna(size)
+    return lambda: sequence.find_motif('GATTACA')
+
+
+def _bench_complement(size):
+    """Prepares DNASequence.complement on a sequence of the given length."""
+    sequence = generate_dna(size)
+    return sequence.complement
+
+
+def _bench_translate(size):
+    """Prepares RNASequence.translate on a sequence of the given length."""
+    sequence = generate_rna(size)
+    return sequence.translate
+
+
+def _bench_polynomial_mul(size):
+    """Prepares Polynomial.__mul__ on two polynomials of the given degree."""
+    p = generate_polynomial(size, seed=SEED)
+    q = generate_polynomial(size, seed=SEED + 1)
+    return lambda: p * q
+
+
+def _bench_polynomial_call(size):
+    """Prepares Polynomial.__call__ on a compiled polynomial of the given degree."""
+    p = generate_polynomial(size)
+    p.compile()
+    return lambda: p(0.5)
+
+
+def _bench_polynomial_call_cold(size):
+    """Prepares building a polynomial of the given degree and evaluating it once."""
+    coefficients = generate_polynomial(size).coefficients[::-1]
+    return lambda: Polynomial(list(coefficients))(0.5)
+
+
+def _bench_find_people_at_risk(size):
+    """Prepares HealthProfile.find_people_at_risk on a cohort of the given size."""
+    profiles = generate_profiles(size)
+    return lambda: HealthProfile.find_people_at_risk(profiles)
+
+
+# Benchmark name -> (size key in SCALES, setup function returning the callable to time).
+BENCHMARKS = {
+    'dna.find_motif': ('dna', _bench_find_motif),
+    'dna.complement': ('dna', _bench_complement),
+    'dna.translate': ('dna', _bench_translate),
+    'polynomial.mul': ('polynomial_mul', _bench_polynomial_mul),
+    'polynomial.call': ('polynomial', _bench_polynomial_call),
+    'polynomial.call_cold': ('polynomial', _bench_polynomial_call_cold),
+    'health.find_people_at_risk': ('health', _bench_find_people_at_risk),
+}
+
+
+def run_benchmarks(scale='small', repeat=5, only=None):
+    """
+    Runs the benchmarks at the given scale.
+
+    Parameters:
+        scale (str): One of the keys of SCALES.
+        repeat (int): Number of timed runs per benchmark. Each run calls the benchmark in a loop
+            sized by timeit's autorange (at least 0.2 s), so short calls are not lost in timer noise.
+        only (list, optional): Name prefixes selecting a subset of BENCHMARKS.
+
+    Returns:
+        dict: Machine-readable results with a "meta" section and per-benchmark timings, in seconds per call.
+    """
+    results = {}
+    for name, (kind, setup) in BENCHMARKS.items():
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        size = SCALES[scale][kind]
+        timer = timeit.Timer(setup(size))
+        loops, _ = timer.autorange()
+        timings = [total / loops for total in timer.repeat(repeat, loops)]
+        results[name] = {'size': size, 'repeat': repeat, 'loops': loops,
+                         'min': min(timings), 'median': statistics.median(timings)}
+    return {
+        'meta': {'scale': scale, 'seed': SEED, 'python': platform.python_version(),
+                 'platform': platform.platform()},
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Compares results against a stored baseline.
+
+    Benchmarks are compared on their minimum time, which is the least noisy statistic; benchmarks
+    missing from either side, or run at a different size, are skipped.
+
+    Parameters:
+        current (dict): Results returned by run_benchmarks().
+        baseline (dict): Previously stored results.
+        threshold (float): Allowed relative slowdown, e.g. 0.10 for 10%.
+
+    Returns:
+        list: Tuples (name, baseline_min, current_min, ratio) for every regression.
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None or base['size'] != result['size'] or base['min'] <= 0:
+            continue
+        ratio = result['min'] / base['min']
+        if ratio > 1 + threshold:
+            regressions.append((name, base['min'], result['min'], ratio))
+    return regressions
+
+
+def missing(current, baseline, only=None):
+    """
+    Lists benchmarks that are in the baseline but were not run, e.g. because they were renamed or removed.
+
+    Parameters:
+        current (dict): Results returned by run_benchmarks().
+        baseline (dict): Previously stored results.
+        only (list, optional): Name prefixes the current run was restricted to; baseline entries
+            outside them are not reported.
+
+    Returns:
+        list: Sorted names of the missing benchmarks.
+    """
+    return sorted(name for name in baseline['results']
+                  if name not in current['results']
+                  and (not only or any(name.startswith(prefix) for prefix in only)))
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Parameters:
+        argv (list, optional): Command-line arguments, defaulting to sys.argv[1:].
+
+    Returns:
+        int: 0 if no regressions or missing benchmarks were found, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--only', nargs='*', help='benchmark name prefixes to run, e.g. dna polynomial.mul')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='allowed relative slowdown')
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.scale, args.repeat, args.only)
+    for name, result in current['results'].items():
+        print(f"{name:30} size={result['size']:<12} min={result['min']:.6f}s median={result['median']:.6f}s")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, args.threshold)
+    for name, base, cur, ratio in regressions:
+        print(f'REGRESSION {name}: {base:.6f}s -> {cur:.6f}s ({ratio:.2f}x)')
+    absent = missing(current, baseline, args.only)
+    for name in absent:
+        print(f'MISSING {name}: in the baseline but not run')
+    return 1 if regressions or absent else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
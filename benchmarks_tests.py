@@ -0,0 +1,86 @@
+import unittest
+from benchmarks import (SCALES, compare, generate_dna, generate_polynomial, generate_profiles, generate_rna,
+                        missing, run_benchmarks)
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    Unit test class for testing the benchmark suite.
+
+    Methods:
+        test_generators(): Tests that the synthetic data generators are sized and reproducible.
+        test_run_benchmarks(): Tests the structure of the benchmark results.
+        test_compare(): Tests regression detection against a baseline.
+        test_missing(): Tests that benchmarks absent from the current run are reported.
+        test_large_mul_capped(): Tests that the quadratic multiplication benchmark has a capped size.
+    """
+
+    def test_generators(self):
+        """
+        Tests the synthetic data generators.
+
+        Asserts:
+            Generated data has the requested size and is identical for the same seed.
+        """
+        self.assertEqual(len(generate_dna(100)), 100)
+        self.assertEqual(generate_dna(100).data, generate_dna(100).data)
+        self.assertEqual(len(generate_rna(100)), 99)
+        self.assertEqual(generate_polynomial(10).degree(), 10)
+        self.assertEqual(len(generate_profiles(5)), 5)
+
+    def test_run_benchmarks(self):
+        """
+        Tests run_benchmarks() on a subset of benchmarks.
+
+        Asserts:
+            Only the selected benchmarks run and each result records size, loop count and timings.
+        """
+        results = run_benchmarks('small', repeat=1, only=['dna.translate'])
+        self.assertEqual(list(results['results']), ['dna.translate'])
+        self.assertEqual(results['meta']['scale'], 'small')
+        self.assertGreaterEqual(results['results']['dna.translate']['loops'], 1)
+        self.assertGreater(results['results']['dna.translate']['min'], 0)
+
+    def test_compare(self):
+        """
+        Tests compare() with a regression threshold of 10%.
+
+        Asserts:
+            A 50% slowdown is reported, a 5% slowdown and a size change are not.
+        """
+        baseline = {'results': {'a': {'size': 10, 'min': 1.0},
+                                'b': {'size': 10, 'min': 1.0},
+                                'c': {'size': 10, 'min': 1.0}}}
+        current = {'results': {'a': {'size': 10, 'min': 1.5},
+                               'b': {'size': 10, 'min': 1.05},
+                               'c': {'size': 20, 'min': 3.0}}}
+        regressions = compare(current, baseline, threshold=0.10)
+        self.assertEqual([r[0] for r in regressions], ['a'])
+        self.assertAlmostEqual(regressions[0][3], 1.5)
+
+    def test_missing(self):
+        """
+        Tests missing() for renamed or dropped benchmarks.
+
+        Asserts:
+            A baseline entry absent from the current run is reported, unless the run was
+            restricted with only to prefixes that exclude it.
+        """
+        baseline = {'results': {'dna.old_name': {'size': 10, 'min': 1.0},
+                                'polynomial.mul': {'size': 10, 'min': 1.0}}}
+        current = {'results': {'polynomial.mul': {'size': 10, 'min': 1.0}}}
+        self.assertEqual(missing(current, baseline), ['dna.old_name'])
+        self.assertEqual(missing(current, baseline, only=['polynomial']), [])
+
+    def test_large_mul_capped(self):
+        """
+        Tests the size of polynomial.mul at the large scale.
+
+        Asserts:
+            The multiplication degree is below the degree used for evaluation.
+        """
+        self.assertLess(SCALES['large']['polynomial_mul'], SCALES['large']['polynomial'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -94,7 +94,7 @@ class DNASequence:
         """
         return RNASequence(self.identifier,
                            self.data.replace('T', 'U'),
-                           self.valid_chars)
+                           RNASequence.valid_chars)
 
 
 class RNASequence(DNASequence):
@@ -21,6 +21,7 @@ class TestSequence(unittest.TestCase):
         test_protein_find_motif(): Tests finding motif function in Protein sequence.
         test_dna_complement(): Tests generation of complement function for DNA sequence.
         test_rna_complement(): Tests generation of complement function for RNA sequence.
+        test_dna_transcribe(): Tests DNA sequence transcription function to RNA sequence.
         test_rna_translate(): Tests RNA sequence translation function to protein sequence.
     """
 
@@ -110,6 +111,10 @@ class TestSequence(unittest.TestCase):
         """Tests generation of complement for RNA sequence."""
         self.assertEqual(str(self.rna.complement()), '>seq2: UAGCUAG')
 
+    def test_dna_transcribe(self):
+        """Tests DNA sequence transcription to RNA sequence."""
+        self.assertEqual(str(self.dna.transcribe()), '>seq1: AUCG')
+
     def test_rna_translate(self):
         """Tests RNA sequence translation to Protein sequence."""
         self.rna = RNASequence('seq2', 'UUUUUU', {'A', 'U', 'C', 'G'})
@@ -0,0 +1,327 @@
+"""
+Opt-in instrumentation of the public methods of DNASequence, Polynomial and HealthProfile.
+
+Usage:
+    import instrumentation
+    instrumentation.enable()
+    ...
+    instrumentation.disable()
+    print(instrumentation.registry.to_prometheus())
+
+enable() replaces the methods listed in TARGETS with timing wrappers and disable() puts the
+original functions back, so nothing is wrapped - and nothing costs extra - while instrumentation
+is off. Each call records its wall time, an input size (sequence length, polynomial degree or
+cohort size) and, if requested, the net number of memory blocks it allocated.
+
+Allocation counts come from sys.getallocatedblocks(), which covers the whole process: calls that
+overlap with work in other threads, such as offloaded pipeline stages, include their allocations.
+"""
+import functools
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from dna import DNASequence, RNASequence
+from health_profile import HealthProfile
+from polynomial import Polynomial, PolynomialBatch
+
+
+def _length(args):
+    """Input size of a sequence method or a cohort function: len() of the first argument."""
+    return len(args[0]) if args else 0
+
+
+def _degree(args):
+    """Input size of a Polynomial method: the degree of the instance."""
+    return args[0].degree() if args else 0
+
+
+def _unsized(args):
+    """Input size of methods working on a single record."""
+    return 0
+
+
+# (class, method name, input size function) for every instrumented method.
+TARGETS = [
+    (DNASequence, 'mutate', _length),
+    (DNASequence, 'find_motif', _length),
+    (DNASequence, 'complement', _length),
+    (DNASequence, 'transcribe', _length),
+    (RNASequence, 'complement', _length),
+    (RNASequence, 'translate', _length),
+    (Polynomial, '__call__', _degree),
+    (Polynomial, '__add__', _degree),
+    (Polynomial, '__sub__', _degree),
+    (Polynomial, '__mul__', _degree),
+    (Polynomial, '__iadd__', _degree),
+    (Polynomial, '__isub__', _degree),
+    (Polynomial, '__imul__', _degree),
+    (PolynomialBatch, '__call__', _length),
+    (PolynomialBatch, '__add__', _length),
+    (PolynomialBatch, '__sub__', _length),
+    (PolynomialBatch, '__mul__', _length),
+    (HealthProfile, 'get_age', _unsized),
+    (HealthProfile, 'get_bmi', _unsized),
+    (HealthProfile, 'calculate_age_stats', _length),
+    (HealthProfile, 'find_people_at_risk', _length),
+]
+
+
+class MethodStats:
+    """
+    Aggregated measurements for one instrumented method.
+
+    Attributes:
+        calls (int): Number of calls.
+        seconds (float): Cumulative wall time in seconds.
+        input_size (int): Sum of the input sizes of all calls.
+        max_input_size (int): Largest input size seen.
+        allocated_blocks (int): Net memory blocks allocated, if allocation tracking is on.
+    """
+
+    def __init__(self):
+        """Initializes all counters to zero."""
+        self.calls = 0
+        self.seconds = 0.0
+        self.input_size = 0
+        self.max_input_size = 0
+        self.allocated_blocks = 0
+
+    def as_dict(self):
+        """
+        Returns the measurements as a plain dictionary.
+
+        Returns:
+            dict: The counters keyed by attribute name.
+        """
+        return {'calls': self.calls, 'seconds': self.seconds, 'input_size': self.input_size,
+                'max_input_size': self.max_input_size, 'allocated_blocks': self.allocated_blocks}
+
+
+class Registry:
+    """
+    An in-process, thread-safe store of MethodStats keyed by "Class.method".
+
+    Methods:
+        record(name, seconds, size, blocks): Adds one call to the statistics of a method.
+        snapshot(): Returns a copy of all statistics as plain dictionaries.
+        reset(): Clears all statistics.
+        to_json(): Returns the statistics as a JSON document.
+        to_prometheus(): Returns the statistics in the Prometheus text exposition format.
+        dump(path, fmt): Writes the statistics to a file in the given format.
+    """
+
+    def __init__(self):
+        """Initializes an empty registry."""
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds, size, blocks=0):
+        """
+        Adds one call to the statistics of a method.
+
+        Parameters:
+            name (str): Method name, e.g. "Polynomial.__mul__".
+            seconds (float): Wall time of the call.
+            size (int): Input size of the call.
+            blocks (int): Net memory blocks allocated by the call.
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = MethodStats()
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.input_size += size
+            stats.max_input_size = max(stats.max_input_size, size)
+            stats.allocated_blocks += blocks
+
+    def snapshot(self):
+        """
+        Returns a copy of all statistics.
+
+        Returns:
+            dict: Method name -> dictionary of counters, sorted by method name.
+        """
+        with self._lock:
+            return {name: self._stats[name].as_dict() for name in sorted(self._stats)}
+
+    def reset(self):
+        """Clears all statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def to_json(self):
+        """
+        Returns the statistics as a JSON document.
+
+        Returns:
+            str: The snapshot serialized as indented JSON.
+        """
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """
+        Returns the statistics in the Prometheus text exposition format.
+
+        Returns:
+            str: One metric family per measurement, labelled by method name. Monotonic totals are
+                counters; the net allocated blocks, which can go down, and the largest input size
+                are gauges.
+        """
+        snapshot = self.snapshot()
+        families = [
+            ('calls', 'method_calls_total', 'counter', 'Number of calls.'),
+            ('seconds', 'method_seconds_total', 'counter', 'Cumulative wall time in seconds.'),
+            ('input_size', 'method_input_size_total', 'counter', 'Sum of input sizes.'),
+            ('max_input_size', 'method_max_input_size', 'gauge', 'Largest input size seen.'),
+            ('allocated_blocks', 'method_allocated_blocks', 'gauge', 'Net memory blocks allocated.'),
+        ]
+        lines = []
+        for key, metric, kind, description in families:
+            lines.append(f'# HELP {metric} {description}')
+            lines.append(f'# TYPE {metric} {kind}')
+            for name, stats in snapshot.items():
+                lines.append(f'{metric}{{method="{name}"}} {stats[key]}')
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path, fmt='json'):
+        """
+        Writes the statistics to a file, e.g. for a textfile collector to scrape.
+
+        Parameters:
+            path (str): Output file path.
+            fmt (str): Either "json" or "prometheus".
+
+        Raises:
+            ValueError: If fmt is not a supported format.
+        """
+        if fmt == 'json':
+            text = self.to_json()
+        elif fmt == 'prometheus':
+            text = self.to_prometheus()
+        else:
+            raise ValueError('Unsupported format: ' + fmt)
+        with open(path, 'w') as f:
+            f.write(text)
+
+
+registry = Registry()
+_originals = {}
+_track_allocations = False
+
+
+def _wrap(name, func, size_of, track_allocations):
+    """
+    Builds a wrapper around func that records each call in the registry.
+
+    Parameters:
+        name (str): Method name used as the registry key.
+        func (callable): The original function.
+        size_of (callable): Function computing the input size from the positional arguments;
+            it is called before func so that in-place methods report their input, not their result.
+        track_allocations (bool): Whether to measure net allocated memory blocks.
+
+    Returns:
+        callable: The instrumented function.
+    """
+    perf_counter = time.perf_counter
+    record = registry.record
+
+    if track_allocations:
+        allocated_blocks = sys.getallocatedblocks
+
+        def wrapper(*args, **kwargs):
+            size = size_of(args)
+            blocks = allocated_blocks()
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start, size, allocated_blocks() - blocks)
+    else:
+        def wrapper(*args, **kwargs):
+            size = size_of(args)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start, size)
+    return functools.wraps(func)(wrapper)
+
+
+def enable(track_allocations=False):
+    """
+    Installs the instrumentation wrappers. Calling it again while enabled has no effect unless
+    track_allocations differs, in which case the wrappers are replaced.
+
+    Parameters:
+        track_allocations (bool): Whether to also record net allocated memory blocks per call.
+            The count is process-wide, see the module docstring.
+    """
+    global _track_allocations
+    if _originals:
+        if track_allocations == _track_allocations:
+            return
+        disable()
+    _track_allocations = track_allocations
+    for cls, method, size_of in TARGETS:
+        raw = cls.__dict__[method]
+        _originals[(cls, method)] = raw
+        name = f'{cls.__name__}.{method}'
+        if isinstance(raw, staticmethod):
+            setattr(cls, method, staticmethod(_wrap(name, raw.__func__, size_of, track_allocations)))
+        else:
+            setattr(cls, method, _wrap(name, raw, size_of, track_allocations))
+
+
+def disable():
+    """Restores the original methods. Recorded statistics are kept in the registry."""
+    for (cls, method), raw in _originals.items():
+        setattr(cls, method, raw)
+    _originals.clear()
+
+
+def is_allocation_tracking():
+    """
+    Reports whether the installed wrappers record allocated memory blocks.
+
+    Returns:
+        bool: True while instrumentation is enabled with allocation tracking.
+    """
+    return bool(_originals) and _track_allocations
+
+
+def is_enabled():
+    """
+    Reports whether the instrumentation wrappers are installed.
+
+    Returns:
+        bool: True while instrumentation is enabled.
+    """
+    return bool(_originals)
+
+
+@contextmanager
+def instrumented(track_allocations=False):
+    """
+    Enables instrumentation for the duration of a with block, then restores the previous state.
+
+    Parameters:
+        track_allocations (bool): Whether to also record net allocated memory blocks per call.
+
+    Yields:
+        Registry: The global registry.
+    """
+    was_enabled = is_enabled()
+    was_tracking = is_allocation_tracking()
+    enable(track_allocations)
+    try:
+        yield registry
+    finally:
+        if not was_enabled:
+            disable()
+        else:
+            enable(was_tracking)
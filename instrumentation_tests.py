@@ -0,0 +1,141 @@
+import json
+import unittest
+import instrumentation
+from dna import DNASequence, RNASequence
+from health_profile import HealthProfile
+from polynomial import Polynomial
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Unit test class for testing the instrumentation layer.
+
+    Methods:
+        setUp(): Clears the registry.
+        tearDown(): Disables instrumentation.
+        test_disabled(): Tests that nothing is wrapped or recorded while disabled.
+        test_records_calls(): Tests call counts and input sizes for each module.
+        test_in_place_input_size(): Tests that in-place methods record the size of their input.
+        test_allocations(): Tests that allocation tracking records a value.
+        test_allocations_while_enabled(): Tests switching on allocation tracking inside an enabled block.
+        test_exports(): Tests the JSON and Prometheus exports.
+    """
+
+    def setUp(self):
+        """Clears the registry before each test."""
+        instrumentation.registry.reset()
+
+    def tearDown(self):
+        """Disables instrumentation after each test."""
+        instrumentation.disable()
+
+    def test_disabled(self):
+        """
+        Tests that disable() restores the original methods.
+
+        Asserts:
+            The class attributes are the originals again and calls are not recorded.
+        """
+        original = Polynomial.__dict__['__mul__']
+        original_static = HealthProfile.__dict__['find_people_at_risk']
+        instrumentation.enable()
+        self.assertIsNot(Polynomial.__dict__['__mul__'], original)
+        instrumentation.disable()
+        self.assertIs(Polynomial.__dict__['__mul__'], original)
+        self.assertIs(HealthProfile.__dict__['find_people_at_risk'], original_static)
+        Polynomial([1, 2]) * Polynomial([3, 4])
+        self.assertEqual(instrumentation.registry.snapshot(), {})
+
+    def test_records_calls(self):
+        """
+        Tests that calls are counted with their input sizes.
+
+        Asserts:
+            find_motif records the sequence length, __mul__ the degree and
+            find_people_at_risk the cohort size; results are unchanged.
+        """
+        with instrumentation.instrumented() as registry:
+            dna = DNASequence('seq1', 'ATCGATCG', {'A', 'T', 'C', 'G'})
+            self.assertEqual(dna.find_motif('AT'), [0, 4])
+            dna.find_motif('CG')
+            self.assertEqual(str(RNASequence('seq2', 'UUUUUU', {'A', 'U', 'C', 'G'}).translate()), '>seq2: FF')
+            self.assertEqual((Polynomial([1, 2]) * Polynomial([3, 4])).coefficients, [3, 10, 8])
+            profiles = [HealthProfile("John", 1990, 180, 75), HealthProfile("Bob", 2000, 170, 80)]
+            self.assertEqual(len(HealthProfile.find_people_at_risk(profiles)), 1)
+        self.assertFalse(instrumentation.is_enabled())
+
+        stats = registry.snapshot()
+        self.assertEqual(stats['DNASequence.find_motif']['calls'], 2)
+        self.assertEqual(stats['DNASequence.find_motif']['input_size'], 16)
+        self.assertEqual(stats['RNASequence.translate']['max_input_size'], 6)
+        self.assertEqual(stats['Polynomial.__mul__']['input_size'], 1)
+        self.assertEqual(stats['HealthProfile.find_people_at_risk']['input_size'], 2)
+        self.assertEqual(stats['HealthProfile.get_bmi']['calls'], 3)
+
+    def test_in_place_input_size(self):
+        """
+        Tests that the input size is taken before the method runs.
+
+        Asserts:
+            *= on a degree 1 polynomial records 1, not the degree of the product,
+            and mutate records the length before mutation.
+        """
+        with instrumentation.instrumented() as registry:
+            p = Polynomial([1, 1])
+            p *= Polynomial([1, 1, 1, 1, 1])
+            p += Polynomial([1])
+            dna = DNASequence('seq1', 'ATCG', {'A', 'T', 'C', 'G'})
+            dna.mutate(4, 'A')
+        stats = registry.snapshot()
+        self.assertEqual(stats['Polynomial.__imul__']['input_size'], 1)
+        self.assertEqual(stats['Polynomial.__iadd__']['input_size'], 5)
+        self.assertEqual(stats['DNASequence.mutate']['input_size'], 4)
+
+    def test_allocations(self):
+        """
+        Tests allocation tracking.
+
+        Asserts:
+            allocated_blocks is recorded as an integer when tracking is enabled.
+        """
+        instrumentation.enable(track_allocations=True)
+        DNASequence('seq1', 'ATCG' * 100, {'A', 'T', 'C', 'G'}).complement()
+        self.assertIsInstance(instrumentation.registry.snapshot()['DNASequence.complement']['allocated_blocks'], int)
+
+    def test_allocations_while_enabled(self):
+        """
+        Tests instrumented(track_allocations=True) inside a block enabled without tracking.
+
+        Asserts:
+            Allocation tracking is active inside the inner block and switched off again after it.
+        """
+        instrumentation.enable()
+        self.assertFalse(instrumentation.is_allocation_tracking())
+        with instrumentation.instrumented(track_allocations=True):
+            self.assertTrue(instrumentation.is_allocation_tracking())
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertFalse(instrumentation.is_allocation_tracking())
+
+    def test_exports(self):
+        """
+        Tests the JSON and Prometheus text exports.
+
+        Asserts:
+            The JSON export parses back to the snapshot and the Prometheus export contains
+            labelled counter lines, with max input size and allocated blocks as gauges.
+        """
+        instrumentation.registry.record('Polynomial.__call__', 0.5, 3)
+        self.assertEqual(json.loads(instrumentation.registry.to_json()), instrumentation.registry.snapshot())
+        text = instrumentation.registry.to_prometheus()
+        self.assertIn('# TYPE method_calls_total counter', text)
+        self.assertIn('method_calls_total{method="Polynomial.__call__"} 1', text)
+        self.assertIn('# TYPE method_max_input_size gauge', text)
+        self.assertIn('method_max_input_size{method="Polynomial.__call__"} 3', text)
+        self.assertIn('# TYPE method_allocated_blocks gauge', text)
+        self.assertNotIn('method_allocated_blocks_total', text)
+        with self.assertRaises(ValueError):
+            instrumentation.registry.dump('unused', fmt='xml')
+
+
+if __name__ == "__main__":
+    unittest.main()
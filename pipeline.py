@@ -0,0 +1,355 @@
+"""
+Asyncio streaming pipeline that moves sequence records through analysis stages.
+
+Usage:
+    stages = sequence_stages('MF')
+    pipeline = Pipeline(stages, maxsize=64)
+    async with aclosing(pipeline.stream(records)) as results:
+        async for protein, positions in results:
+            ...
+    print(pipeline.report())
+
+aclosing (from contextlib) makes sure the stage tasks are stopped and elapsed is recorded even
+when the loop exits early with break or an exception; run() does this for you.
+
+Stages are connected by bounded asyncio queues, so a slow stage makes the stages in front of it
+wait instead of buffering the whole input (backpressure). Offloaded stages run in an executor -
+the loop's default thread pool, or any concurrent.futures executor passed to Pipeline, such as a
+ProcessPoolExecutor for CPU-heavy work. Every stage keeps its own throughput statistics; busy
+time is measured around the stage function itself, inside the executor, so it excludes time spent
+waiting for a free worker or pickling records.
+
+Records for which a stage raises an exception are dropped from the stream. The failure is counted,
+kept in the stage's recent_errors and passed to the optional on_error callback.
+"""
+import asyncio
+import time
+from collections import deque
+from functools import partial
+
+from dna import DNASequence
+
+_DONE = object()
+
+
+class _Abort:
+    """Marker sent to the consumer when a worker fails, carrying the exception to re-raise."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class Stage:
+    """
+    A single step of a Pipeline.
+
+    Attributes:
+        name (str): Name used in the throughput report.
+        func (callable): Function applied to every record; must be picklable for process pools.
+        offload (bool): Whether func runs in the pipeline's executor instead of on the event loop.
+        workers (int): Number of records processed concurrently; with more than one, order is not kept.
+    """
+
+    def __init__(self, name, func, offload=True, workers=1):
+        """
+        Initializes a Stage.
+
+        Parameters:
+            name (str): Name used in the throughput report.
+            func (callable): Function applied to every record.
+            offload (bool): Whether func runs in the pipeline's executor.
+            workers (int): Number of records processed concurrently.
+
+        Raises:
+            ValueError: If workers is less than 1.
+        """
+        if workers < 1:
+            raise ValueError('workers must be at least 1')
+        self.name = name
+        self.func = func
+        self.offload = offload
+        self.workers = workers
+
+
+class StageStats:
+    """
+    Throughput statistics of one stage.
+
+    Attributes:
+        items (int): Records the stage produced.
+        errors (int): Records dropped because the stage raised an exception.
+        busy_seconds (float): Time spent in the stage function, summed over workers.
+        recent_errors (deque): The last MAX_ERRORS (record, exception) pairs of failed records.
+    """
+    MAX_ERRORS = 10
+
+    def __init__(self):
+        """Initializes all counters to zero."""
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.recent_errors = deque(maxlen=self.MAX_ERRORS)
+
+    def as_dict(self):
+        """
+        Returns the statistics as a plain dictionary.
+
+        Returns:
+            dict: The counters, the repr of the recent errors and throughput, the records per
+                busy second a single worker sustains.
+        """
+        processed = self.items + self.errors
+        throughput = processed / self.busy_seconds if self.busy_seconds else 0.0
+        return {'items': self.items, 'errors': self.errors,
+                'recent_errors': [repr(exc) for _, exc in self.recent_errors],
+                'busy_seconds': self.busy_seconds, 'throughput': throughput}
+
+
+class Pipeline:
+    """
+    A chain of stages connected by bounded queues.
+
+    Attributes:
+        stages (list): The Stage instances, in processing order.
+        maxsize (int): Capacity of each queue between stages.
+        executor (Executor): Executor for offloaded stages; None uses the loop's default thread pool.
+        on_error (callable): Called as on_error(stage_name, record, exception) for every failed record.
+        stats (dict): Stage name -> StageStats for the most recent run.
+        elapsed (float): Wall time of the most recent run in seconds.
+
+    Methods:
+        stream(source): Asynchronously yields the records leaving the last stage.
+        run(source): Processes the whole source and returns the results as a list.
+        report(): Returns per-stage throughput statistics.
+    """
+
+    def __init__(self, stages, maxsize=64, executor=None, on_error=None):
+        """
+        Initializes a Pipeline.
+
+        Parameters:
+            stages (list): The Stage instances, in processing order.
+            maxsize (int): Capacity of each queue between stages.
+            executor (Executor, optional): Executor for offloaded stages.
+            on_error (callable, optional): Called with (stage_name, record, exception) for every
+                failed record; an exception raised by it aborts the run.
+
+        Raises:
+            ValueError: If two stages share a name.
+        """
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError('Duplicate stage names: ' + str(sorted({n for n in names if names.count(n) > 1})))
+        self.stages = stages
+        self.maxsize = maxsize
+        self.executor = executor
+        self.on_error = on_error
+        self.stats = {stage.name: StageStats() for stage in stages}
+        self.elapsed = 0.0
+
+    async def _produce(self, source, queue):
+        """
+        Feeds records from a sync or async iterable into the first queue.
+
+        Parameters:
+            source (iterable or async iterable): The input records.
+            queue (asyncio.Queue): The queue of the first stage.
+        """
+        try:
+            if hasattr(source, '__aiter__'):
+                async for record in source:
+                    await queue.put(record)
+            else:
+                for record in source:
+                    await queue.put(record)
+        except Exception:
+            await queue.put(_DONE)
+            raise
+        await queue.put(_DONE)
+
+    async def _work(self, stage, stats, queue_in, queue_out, remaining, results):
+        """
+        Processes records of one stage until the end of the stream is reached.
+
+        If the worker itself fails, e.g. because on_error raised, the exception is sent to the
+        consumer so that the stream stops instead of waiting for records that never arrive.
+
+        Parameters:
+            stage (Stage): The stage to run.
+            stats (StageStats): Statistics of the stage.
+            queue_in (asyncio.Queue): Queue the records are read from.
+            queue_out (asyncio.Queue): Queue the results are written to.
+            remaining (list): Single-element list counting the workers of the stage still running.
+            results (asyncio.Queue): Queue read by the consumer of the pipeline.
+        """
+        try:
+            await self._process(stage, stats, queue_in, queue_out, remaining)
+        except Exception as error:
+            await results.put(_Abort(error))
+
+    async def _process(self, stage, stats, queue_in, queue_out, remaining):
+        """
+        The loop of _work, reading from queue_in and writing to queue_out.
+
+        Parameters:
+            stage (Stage): The stage to run.
+            stats (StageStats): Statistics of the stage.
+            queue_in (asyncio.Queue): Queue the records are read from.
+            queue_out (asyncio.Queue): Queue the results are written to.
+            remaining (list): Single-element list counting the workers of the stage still running.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            record = await queue_in.get()
+            if record is _DONE:
+                remaining[0] -= 1
+                await (queue_out if remaining[0] == 0 else queue_in).put(_DONE)
+                return
+            if stage.offload:
+                result, elapsed, error = await loop.run_in_executor(self.executor, _timed, stage.func, record)
+            else:
+                result, elapsed, error = _timed(stage.func, record)
+            stats.busy_seconds += elapsed
+            if error is not None:
+                stats.errors += 1
+                stats.recent_errors.append((record, error))
+                if self.on_error is not None:
+                    self.on_error(stage.name, record, error)
+                continue
+            stats.items += 1
+            await queue_out.put(result)
+
+    async def stream(self, source):
+        """
+        Streams records through all stages.
+
+        Records for which a stage raises an exception are dropped; see StageStats and on_error.
+
+        Iterate inside ``async with contextlib.aclosing(pipeline.stream(source))``: if the loop stops
+        early, closing the generator cancels the stage tasks and records elapsed. An unclosed
+        stream leaves them running until the generator is garbage-collected.
+
+        Parameters:
+            source (iterable or async iterable): The input records.
+
+        Yields:
+            The records leaving the last stage.
+        """
+        self.stats = {stage.name: StageStats() for stage in self.stages}
+        queues = [asyncio.Queue(self.maxsize) for _ in range(len(self.stages) + 1)]
+        tasks = [asyncio.create_task(self._produce(source, queues[0]))]
+        for i, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            for _ in range(stage.workers):
+                tasks.append(asyncio.create_task(
+                    self._work(stage, self.stats[stage.name], queues[i], queues[i + 1], remaining, queues[-1])))
+
+        start = time.perf_counter()
+        try:
+            while True:
+                record = await queues[-1].get()
+                if record is _DONE:
+                    break
+                if isinstance(record, _Abort):
+                    raise record.error
+                yield record
+            await asyncio.gather(*tasks)
+        finally:
+            self.elapsed = time.perf_counter() - start
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, source):
+        """
+        Processes the whole source.
+
+        Parameters:
+            source (iterable or async iterable): The input records.
+
+        Returns:
+            list: The records leaving the last stage.
+        """
+        return [record async for record in self.stream(source)]
+
+    def report(self):
+        """
+        Returns per-stage throughput statistics of the most recent run.
+
+        Returns:
+            dict: Stage name -> statistics, plus "elapsed" and the overall records per second.
+        """
+        report = {name: stats.as_dict() for name, stats in self.stats.items()}
+        produced = self.stats[self.stages[-1].name].items if self.stages else 0
+        report['elapsed'] = self.elapsed
+        report['throughput'] = produced / self.elapsed if self.elapsed else 0.0
+        return report
+
+
+def _timed(func, record):
+    """
+    Applies a stage function and measures it where it runs, e.g. inside a worker process.
+
+    Parameters:
+        func (callable): The stage function.
+        record: The record to process.
+
+    Returns:
+        tuple: (result, elapsed seconds, exception), with result None if func raised.
+    """
+    start = time.perf_counter()
+    try:
+        return func(record), time.perf_counter() - start, None
+    except Exception as exc:
+        return None, time.perf_counter() - start, exc
+
+
+def _validate(record, valid_chars):
+    """Builds a DNASequence from an (identifier, data) record, raising ValueError on invalid data."""
+    identifier, data = record
+    return DNASequence(identifier, data, set(valid_chars))
+
+
+def _complement(sequence):
+    """Returns the complement of a sequence."""
+    return sequence.complement()
+
+
+def _transcribe(sequence):
+    """Returns the RNA transcription of a DNA sequence."""
+    return sequence.transcribe()
+
+
+def _translate(sequence):
+    """Returns the protein translation of an RNA sequence."""
+    return sequence.translate()
+
+
+def _find_motif(sequence, motif):
+    """Returns the sequence together with the start positions of motif."""
+    return sequence, sequence.find_motif(motif)
+
+
+def sequence_stages(motif, valid_chars=('A', 'T', 'C', 'G'), offload=True, workers=1):
+    """
+    Builds the standard validate -> complement -> transcribe -> translate -> find_motif stages.
+
+    The input records are (identifier, data) tuples and the output records are
+    (ProteinSequence, positions) tuples.
+
+    Parameters:
+        motif (str): The protein motif to search for.
+        valid_chars (iterable): Valid characters of the input DNA.
+        offload (bool): Whether the stages run in the pipeline's executor.
+        workers (int): Number of records each stage processes concurrently.
+
+    Returns:
+        list: The Stage instances, in processing order.
+    """
+    return [
+        Stage('validate', partial(_validate, valid_chars=tuple(valid_chars)), offload, workers),
+        Stage('complement', _complement, offload, workers),
+        Stage('transcribe', _transcribe, offload, workers),
+        Stage('translate', _translate, offload, workers),
+        Stage('find_motif', partial(_find_motif, motif=motif), offload, workers),
+    ]
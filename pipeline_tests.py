@@ -0,0 +1,182 @@
+import asyncio
+import unittest
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
+from pipeline import Pipeline, Stage, sequence_stages
+
+
+class TestPipeline(unittest.TestCase):
+    """
+    Unit test class for testing the streaming Pipeline.
+
+    Methods:
+        setUp(): Initializes the input records.
+        test_sequence_stages(): Tests the standard stages end to end.
+        test_backpressure(): Tests that the producer is held back by a full queue.
+        test_early_exit(): Tests that breaking out of an aclosing stream stops the stage tasks.
+        test_workers(): Tests a stage with several workers and an explicit executor.
+        test_async_source(): Tests an async iterable as input.
+        test_source_error(): Tests that an exception raised by the source is propagated.
+        test_stage_errors_reported(): Tests that records failing a stage are reported, not only counted.
+        test_on_error_abort(): Tests that an exception raised by on_error aborts the run.
+        test_duplicate_stage_names(): Tests that stages must have unique names.
+    """
+
+    def setUp(self):
+        """
+        Sets up (identifier, data) records for testing.
+
+        Instances:
+            records: Two valid DNA records and one with an invalid character.
+        """
+        self.records = [('seq1', 'AAAAAG'), ('seq2', 'AAAAXG'), ('seq3', 'TACAAA')]
+
+    def test_sequence_stages(self):
+        """
+        Tests validate -> complement -> transcribe -> translate -> find_motif.
+
+        Asserts:
+            Valid records are translated and searched, the invalid record is counted
+            as a validation error, and the report covers every stage.
+        """
+        pipeline = Pipeline(sequence_stages('F'), maxsize=2)
+        results = asyncio.run(pipeline.run(self.records))
+        self.assertEqual([(str(protein), positions) for protein, positions in results],
+                         [('>seq1: FF', [0, 1]), ('>seq3: MF', [1])])
+        report = pipeline.report()
+        self.assertEqual(report['validate']['errors'], 1)
+        self.assertEqual(report['find_motif']['items'], 2)
+        self.assertGreater(report['elapsed'], 0)
+
+    def test_backpressure(self):
+        """
+        Tests that a bounded queue limits how far the producer runs ahead.
+
+        Asserts:
+            After the first result the source has yielded only a few records, not all of them.
+        """
+        produced = []
+
+        def source():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        async def first():
+            pipeline = Pipeline([Stage('identity', lambda x: x, offload=False)], maxsize=1)
+            async with aclosing(pipeline.stream(source())) as stream:
+                await stream.__anext__()
+                return len(produced)
+
+        self.assertLess(asyncio.run(first()), 10)
+
+    def test_early_exit(self):
+        """
+        Tests breaking out of the documented aclosing(pipeline.stream(...)) loop.
+
+        Asserts:
+            After the block, no pipeline tasks are left running and elapsed is recorded.
+        """
+        async def first():
+            pipeline = Pipeline([Stage('identity', lambda x: x, offload=False)], maxsize=1)
+            async with aclosing(pipeline.stream(range(100))) as stream:
+                async for _ in stream:
+                    break
+            others = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            return pipeline, others
+
+        pipeline, others = asyncio.run(first())
+        self.assertEqual(others, [])
+        self.assertGreater(pipeline.report()['elapsed'], 0)
+
+    def test_workers(self):
+        """
+        Tests a stage with several workers running in an explicit executor.
+
+        Asserts:
+            Every record is processed exactly once.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pipeline = Pipeline([Stage('square', lambda x: x * x, workers=4)], executor=executor)
+            results = asyncio.run(pipeline.run(range(50)))
+        self.assertEqual(sorted(results), [x * x for x in range(50)])
+        self.assertEqual(pipeline.report()['square']['items'], 50)
+
+    def test_async_source(self):
+        """
+        Tests an async iterable as the pipeline source.
+
+        Asserts:
+            Records from an async generator are processed in order.
+        """
+        async def source():
+            for record in self.records:
+                yield record
+
+        pipeline = Pipeline(sequence_stages('M', offload=False))
+        results = asyncio.run(pipeline.run(source()))
+        self.assertEqual([str(protein) for protein, _ in results], ['>seq1: FF', '>seq3: MF'])
+
+    def test_source_error(self):
+        """
+        Tests that an exception raised by the source reaches the caller.
+
+        Asserts:
+            run() raises the RuntimeError raised by the source.
+        """
+        def source():
+            yield 1
+            raise RuntimeError('broken reader')
+
+        pipeline = Pipeline([Stage('identity', lambda x: x)])
+        with self.assertRaises(RuntimeError):
+            asyncio.run(pipeline.run(source()))
+
+    def test_stage_errors_reported(self):
+        """
+        Tests that a record whose length is not a multiple of 3 is reported by the translate stage.
+
+        Asserts:
+            on_error receives the stage name and the exception, and the report lists the error.
+        """
+        failures = []
+        pipeline = Pipeline(sequence_stages('F'), on_error=lambda *failure: failures.append(failure))
+        results = asyncio.run(pipeline.run([('t', 'AAAAA'), ('seq1', 'AAAAAG')]))
+        self.assertEqual(len(results), 1)
+        self.assertEqual(len(failures), 1)
+        stage_name, record, error = failures[0]
+        self.assertEqual(stage_name, 'translate')
+        self.assertEqual(record.identifier, 't')
+        self.assertIsInstance(error, KeyError)
+        report = pipeline.report()['translate']
+        self.assertEqual(report['errors'], 1)
+        self.assertEqual(report['recent_errors'], [repr(error)])
+        self.assertIs(pipeline.stats['translate'].recent_errors[0][1], error)
+
+    def test_on_error_abort(self):
+        """
+        Tests that on_error can abort the run by raising.
+
+        Asserts:
+            run() raises the exception re-raised by on_error.
+        """
+        def on_error(stage_name, record, error):
+            raise error
+
+        pipeline = Pipeline([Stage('invert', lambda x: 1 / x, offload=False)], on_error=on_error)
+        with self.assertRaises(ZeroDivisionError):
+            asyncio.run(pipeline.run([1, 0, 2]))
+
+    def test_duplicate_stage_names(self):
+        """
+        Tests that two stages with the same name are rejected.
+
+        Asserts:
+            Pipeline() raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            Pipeline([Stage('a', abs), Stage('a', abs)])
+
+
+if __name__ == "__main__":
+    unittest.main()
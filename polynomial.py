@@ -1,3 +1,8 @@
+from functools import lru_cache
+from numbers import Number
+from operator import add, mul, sub
+
+
 class Polynomial:
     """
     A class representing a polynomial, supporting basic operations such as addition, subtraction,
@@ -5,18 +10,23 @@ class Polynomial:
 
     Attributes:
         coefficients (list): A list of polynomial coefficients ordered from the highest degree to the constant term.
+        UNROLL_LIMIT (int): Highest degree for which compile() generates a straight-line Horner function.
 
     Methods:
         degree(): Returns the degree of the polynomial.
         __str__(): Returns the polynomial in string form, e.g., "3x^2 + 2x + 1".
         __call__(x): Evaluates the polynomial at a given value of x.
+        compile(memo_size): Builds (or returns the cached) evaluation plan and makes __call__ use it.
         __add__(other): Adds two polynomials and returns the result as a new Polynomial instance.
         __sub__(other): Subtracts one polynomial from another and returns the result as a new Polynomial instance.
         __mul__(other): Multiplies two polynomials and returns the result as a new Polynomial instance.
         __iadd__(other): Adds another polynomial in-place and updates the coefficients.
         __isub__(other): Subtracts another polynomial in-place and updates the coefficients.
         __imul__(other): Multiplies by another polynomial in-place and updates the coefficients.
+
+    See PolynomialBatch for arithmetic over many small polynomials at once.
     """
+    UNROLL_LIMIT = 32
 
     def __init__(self, coefficients):
         """
@@ -28,6 +38,21 @@ class Polynomial:
         while len(coefficients) > 1 and coefficients[-1] == 0:
             coefficients.pop()
         self.coefficients = coefficients[::-1]  # Store coefficients in reverse for easy access
+        self._plan = None
+        self._plan_key = None
+        self._memo_size = 0
+
+    def __getstate__(self):
+        """
+        Returns the state for pickling, without the generated evaluation plan.
+
+        Returns:
+            dict: The instance attributes with the plan removed; it is rebuilt on the next call.
+        """
+        state = self.__dict__.copy()
+        state['_plan'] = None
+        state['_plan_key'] = None
+        return state
 
     def degree(self):
         """
@@ -69,14 +94,103 @@ class Polynomial:
         """
         Evaluates the polynomial at a given value of x.
 
+        Once compile() has been called, the cached plan is used and rebuilt whenever the coefficients
+        no longer match the ones it was compiled for; otherwise the coefficients are summed directly.
+
         Parameters:
             x (float or int): The value at which to evaluate the polynomial.
 
         Returns:
             float: The result of the polynomial evaluated at x.
         """
+        plan = self._plan
+        if plan is not None:
+            if self.coefficients != self._plan_key:
+                plan = self.compile()
+            return plan(x)
         return sum([self.coefficients[i] * x**i for i in range(len(self.coefficients))])
 
+    def compile(self, memo_size=None):
+        """
+        Compiles the polynomial into a Horner-scheme evaluation function and caches it on the instance.
+
+        Compiling costs far more than a single evaluation, so it pays off only for polynomials that
+        are evaluated many times. Polynomials up to UNROLL_LIMIT are turned into a generated
+        straight-line function such as ``(c2 * x + c1) * x + c0``; higher degrees fall back to a
+        Horner loop over a tuple. The plan records the coefficients it was built from and is rebuilt
+        when they change, whether through +=, -=, *=, assignment to coefficients or in-place edits
+        such as ``p.coefficients[0] = 100``. The plan is not pickled.
+
+        Parameters:
+            memo_size (int, optional): Number of recent (x -> value) results to keep in an LRU memo.
+                0 disables the memo; None keeps the current setting. Unhashable values of x
+                bypass the memo and are evaluated directly.
+
+        Returns:
+            callable: A function taking x and returning the polynomial evaluated at x.
+        """
+        if memo_size is not None and memo_size != self._memo_size:
+            if memo_size < 0:
+                raise ValueError('memo_size must be non-negative')
+            self._memo_size = memo_size
+            self._plan = None
+        if self._plan is None or self.coefficients != self._plan_key:
+            plan = self._build_plan()
+            if self._memo_size:
+                plan = self._memoise(plan, self._memo_size)
+            self._plan = plan
+            self._plan_key = list(self.coefficients)
+        return self._plan
+
+    def _build_plan(self):
+        """
+        Builds a fresh Horner evaluation function for the current coefficients.
+
+        Returns:
+            callable: A function taking x and returning the polynomial evaluated at x.
+        """
+        if self.degree() <= self.UNROLL_LIMIT:
+            namespace = {f'c{i}': coeff for i, coeff in enumerate(self.coefficients)}
+            expr = f'c{self.degree()}'
+            for i in range(self.degree() - 1, -1, -1):
+                expr = f'({expr}) * x + c{i}'
+            exec(f'def plan(x):\n    return {expr}\n', namespace)
+            return namespace['plan']
+
+        leading = self.coefficients[-1]
+        coeffs = tuple(reversed(self.coefficients[:-1]))
+
+        def plan(x):
+            result = leading
+            for coeff in coeffs:
+                result = result * x + coeff
+            return result
+        return plan
+
+    @staticmethod
+    def _memoise(plan, memo_size):
+        """
+        Wraps an evaluation function in a bounded LRU memo of recent results.
+
+        Parameters:
+            plan (callable): The evaluation function.
+            memo_size (int): Maximum number of memoised results.
+
+        Returns:
+            callable: The memoised function, exposing cache_info() and cache_clear().
+        """
+        memo = lru_cache(maxsize=memo_size)(plan)
+
+        def memoised(x):
+            try:
+                hash(x)
+            except TypeError:
+                return plan(x)
+            return memo(x)
+        memoised.cache_info = memo.cache_info
+        memoised.cache_clear = memo.cache_clear
+        return memoised
+
     def __add__(self, other):
         """
         Adds two polynomials and returns the result as a new Polynomial instance.
@@ -169,4 +283,222 @@ class Polynomial:
         """
         result = self * other
         self.coefficients = result.coefficients
-        return self
\ No newline at end of file
+        return self
+
+    @classmethod
+    def _from_stored(cls, coefficients):
+        """
+        Creates a Polynomial directly from coefficients in storage order (constant term first).
+
+        Parameters:
+            coefficients (list): Coefficients ordered from the constant term to the highest degree.
+
+        Returns:
+            Polynomial: A new Polynomial with trailing high-degree zeros removed.
+        """
+        coefficients = list(coefficients)
+        while len(coefficients) > 1 and coefficients[-1] == 0:
+            coefficients.pop()
+        poly = cls([0])
+        poly.coefficients = coefficients
+        return poly
+
+
+class PolynomialBatch:
+    """
+    A class representing N polynomials stored together as a 2-D coefficient array, so that
+    arithmetic and evaluation run across the whole batch at once instead of one object at a time.
+
+    The array is stored column-major: columns[k][n] is the coefficient of x^k in the n-th polynomial.
+    Every operation loops over the (small) degree while the batch dimension is handled by map/zip.
+
+    The batch follows standard polynomial arithmetic, which differs from Polynomial in two places:
+    Polynomial.__add__, __sub__ and __mul__ return their coefficients in reversed order, and the
+    Polynomial constructor strips zeros from the constant end, so Polynomial([1, 0]) is the
+    constant 1 while PolynomialBatch([[1, 0]]) holds x. Evaluating a batch result at x gives the
+    same value as combining the Polynomial values at x, e.g. (a + b)(x) == [p(x) + q(x), ...].
+
+    Attributes:
+        columns (list): A list of columns, one per power of x, each holding N coefficients.
+
+    Methods:
+        from_polynomials(polynomials): Builds a batch from a list of Polynomial instances.
+        to_polynomials(): Converts the batch back into a list of Polynomial instances.
+        degree(): Returns the highest degree in the batch.
+        __len__(): Returns the number of polynomials in the batch.
+        __call__(x): Evaluates every polynomial at x, or at the matching element of a sequence of x values.
+        __add__(other): Adds two batches element-wise.
+        __sub__(other): Subtracts two batches element-wise.
+        __mul__(other): Multiplies two batches element-wise.
+    """
+
+    def __init__(self, coefficients):
+        """
+        Initializes the batch from one coefficient list per polynomial.
+
+        Parameters:
+            coefficients (list): A list of coefficient lists, each ordered from the highest degree
+                to the constant term. Only zeros of the highest degrees are dropped; see the class
+                docstring for how this differs from the Polynomial constructor.
+        """
+        rows = [row[::-1] for row in coefficients]
+        width = max((len(row) for row in rows), default=1)
+        padded = [row + [0] * (width - len(row)) for row in rows]
+        self.columns = [list(column) for column in zip(*padded)] or [[]]
+        self._trim()
+
+    @classmethod
+    def _from_columns(cls, columns):
+        """
+        Creates a batch directly from columns in storage order.
+
+        Parameters:
+            columns (list): A list of columns, one per power of x.
+
+        Returns:
+            PolynomialBatch: A new batch wrapping the given columns.
+        """
+        batch = cls.__new__(cls)
+        batch.columns = columns
+        batch._trim()
+        return batch
+
+    @classmethod
+    def from_polynomials(cls, polynomials):
+        """
+        Builds a batch from a list of Polynomial instances.
+
+        Parameters:
+            polynomials (list): A list of Polynomial instances.
+
+        Returns:
+            PolynomialBatch: A batch holding the given polynomials in order.
+        """
+        return cls([poly.coefficients[::-1] for poly in polynomials])
+
+    def to_polynomials(self):
+        """
+        Converts the batch back into a list of Polynomial instances.
+
+        Returns:
+            list: A list of Polynomial instances, one per row of the batch.
+        """
+        return [Polynomial._from_stored(row) for row in zip(*self.columns)]
+
+    def _trim(self):
+        """Removes high-degree columns that are zero for every polynomial in the batch."""
+        while len(self.columns) > 1 and not any(self.columns[-1]):
+            self.columns.pop()
+
+    def _check_size(self, other):
+        """
+        Ensures that another batch holds the same number of polynomials.
+
+        Raises:
+            ValueError: If the batch sizes differ.
+        """
+        if len(self) != len(other):
+            raise ValueError(f'Batch size mismatch: {len(self)} != {len(other)}')
+
+    def degree(self):
+        """
+        Returns the highest degree of any polynomial in the batch.
+
+        Returns:
+            int: Number of stored columns minus one.
+        """
+        return len(self.columns) - 1
+
+    def __len__(self):
+        """Returns the number of polynomials in the batch."""
+        return len(self.columns[0])
+
+    def __call__(self, x):
+        """
+        Evaluates every polynomial in the batch using Horner's scheme.
+
+        Parameters:
+            x (Number or list): A single value shared by the whole batch, or one value per polynomial.
+
+        Returns:
+            list: The value of each polynomial at its x.
+
+        Raises:
+            ValueError: If x is a sequence whose length differs from the batch size.
+        """
+        if isinstance(x, Number):
+            xs = [x] * len(self)
+        else:
+            xs = list(x)
+            if len(xs) != len(self):
+                raise ValueError(f'Batch size mismatch: {len(self)} != {len(xs)}')
+        result = list(self.columns[-1])
+        for column in reversed(self.columns[:-1]):
+            result = [r * v + c for r, v, c in zip(result, xs, column)]
+        return result
+
+    def __add__(self, other):
+        """
+        Adds two batches element-wise.
+
+        Parameters:
+            other (PolynomialBatch): The batch to add.
+
+        Returns:
+            PolynomialBatch: A new batch where each polynomial is the sum of the matching pair,
+                or NotImplemented if other is not a PolynomialBatch.
+        """
+        if not isinstance(other, PolynomialBatch):
+            return NotImplemented
+        self._check_size(other)
+        zeros = [0] * len(self)
+        width = max(len(self.columns), len(other.columns))
+        return PolynomialBatch._from_columns([
+            list(map(add,
+                     self.columns[k] if k < len(self.columns) else zeros,
+                     other.columns[k] if k < len(other.columns) else zeros))
+            for k in range(width)
+        ])
+
+    def __sub__(self, other):
+        """
+        Subtracts two batches element-wise.
+
+        Parameters:
+            other (PolynomialBatch): The batch to subtract.
+
+        Returns:
+            PolynomialBatch: A new batch where each polynomial is the difference of the matching pair,
+                or NotImplemented if other is not a PolynomialBatch.
+        """
+        if not isinstance(other, PolynomialBatch):
+            return NotImplemented
+        self._check_size(other)
+        zeros = [0] * len(self)
+        width = max(len(self.columns), len(other.columns))
+        return PolynomialBatch._from_columns([
+            list(map(sub,
+                     self.columns[k] if k < len(self.columns) else zeros,
+                     other.columns[k] if k < len(other.columns) else zeros))
+            for k in range(width)
+        ])
+
+    def __mul__(self, other):
+        """
+        Multiplies two batches element-wise.
+
+        Parameters:
+            other (PolynomialBatch): The batch to multiply.
+
+        Returns:
+            PolynomialBatch: A new batch where each polynomial is the product of the matching pair,
+                or NotImplemented if other is not a PolynomialBatch.
+        """
+        if not isinstance(other, PolynomialBatch):
+            return NotImplemented
+        self._check_size(other)
+        new_columns = [[0] * len(self) for _ in range(self.degree() + other.degree() + 1)]
+        for i, left in enumerate(self.columns):
+            for j, right in enumerate(other.columns):
+                new_columns[i + j] = list(map(add, new_columns[i + j], map(mul, left, right)))
+        return PolynomialBatch._from_columns(new_columns)
@@ -1,5 +1,9 @@
+import copy
+import pickle
 import unittest
-from polynomial import Polynomial
+from decimal import Decimal
+from fractions import Fraction
+from polynomial import Polynomial, PolynomialBatch
 
 class TestPolynomial(unittest.TestCase):
     """
@@ -15,6 +19,13 @@ class TestPolynomial(unittest.TestCase):
         test_iadd(): Tests in-place addition of two polynomials.
         test_isub(): Tests in-place subtraction of two polynomials.
         test_imul(): Tests in-place multiplication of two polynomials.
+        test_compile(): Tests that the compiled evaluation plan is cached and matches __call__.
+        test_compile_invalidated(): Tests that in-place operations discard the cached plan.
+        test_compile_direct_edit(): Tests that editing coefficients directly discards the cached plan.
+        test_compile_infinity(): Tests that the unrolled and looped plans agree at infinity.
+        test_compile_copy(): Tests that copies see edits to the shared coefficient list.
+        test_pickle(): Tests that compiled polynomials can be pickled.
+        test_compile_memo(): Tests the optional LRU memo of recent results.
     """
 
     def test_degree(self):
@@ -139,5 +150,260 @@ class TestPolynomial(unittest.TestCase):
         p *= q
         self.assertEqual(p.coefficients, [3, 10, 8])
 
+    def test_compile(self):
+        """
+        Tests the compile() method for both the unrolled and the looped Horner plans.
+
+        Asserts:
+            compile() returns the same cached plan on repeated calls.
+            The plan evaluates Polynomial([1, 2, 3]) to 3 at x=0 and 6 at x=1.
+            A polynomial above UNROLL_LIMIT evaluates to the same value as the naive sum.
+        """
+        p = Polynomial([1, 2, 3])
+        plan = p.compile()
+        self.assertIs(p.compile(), plan)
+        self.assertEqual(plan(0), 3)
+        self.assertEqual(plan(1), 6)
+
+        coeffs = list(range(1, Polynomial.UNROLL_LIMIT + 10))
+        q = Polynomial(list(coeffs))
+        expected = sum(c * 2 ** i for i, c in enumerate(q.coefficients))
+        self.assertEqual(q.compile()(2), expected)
+        self.assertEqual(q(2), expected)
+
+    def test_compile_invalidated(self):
+        """
+        Tests that +=, -= and *= discard the cached evaluation plan.
+
+        Asserts:
+            After each in-place operation, p(2) matches the naive sum over the updated coefficients.
+        """
+        def naive(poly, x):
+            return sum(c * x ** i for i, c in enumerate(poly.coefficients))
+
+        p = Polynomial([1, 2])
+        p.compile()
+        self.assertEqual(p(2), naive(p, 2))
+        p += Polynomial([1])
+        self.assertEqual(p(2), naive(p, 2))
+        p -= Polynomial([2, 0])
+        self.assertEqual(p(2), naive(p, 2))
+        p *= Polynomial([1, 1, 3])
+        self.assertEqual(p(2), naive(p, 2))
+
+    def test_compile_direct_edit(self):
+        """
+        Tests that changes made through the coefficients attribute discard the cached plan.
+
+        Asserts:
+            p(2) reflects item assignment, append and assignment of a new list.
+        """
+        p = Polynomial([1, 2, 3])
+        p.compile()
+        self.assertEqual(p(2), 11)
+        p.coefficients[0] = 100
+        self.assertEqual(p(2), 108)
+        p.coefficients.append(1)
+        self.assertEqual(p(2), 116)
+        p.coefficients = [1, 1]
+        self.assertEqual(p(2), 3)
+
+    def test_compile_infinity(self):
+        """
+        Tests evaluation at infinity for polynomials below and above UNROLL_LIMIT.
+
+        Asserts:
+            Both evaluation plans return inf for positive coefficients at x=inf.
+        """
+        inf = float('inf')
+        self.assertEqual(Polynomial([1, 2, 3]).compile()(inf), inf)
+        self.assertEqual(Polynomial(list(range(1, Polynomial.UNROLL_LIMIT + 10))).compile()(inf), inf)
+
+    def test_compile_copy(self):
+        """
+        Tests that a shallow copy and the original both follow edits to their shared coefficients.
+
+        Asserts:
+            After q = copy.copy(p) and q.coefficients[0] = 100, p(2) and q(2) both return 108.
+        """
+        p = Polynomial([1, 2, 3])
+        p.compile()
+        self.assertEqual(p(2), 11)
+        q = copy.copy(p)
+        q.compile()
+        q.coefficients[0] = 100
+        self.assertEqual(q(2), 108)
+        self.assertEqual(p(2), 108)
+
+    def test_pickle(self):
+        """
+        Tests a pickle round trip of a compiled polynomial.
+
+        Asserts:
+            The unpickled polynomial has the same coefficients and evaluates to the same values.
+        """
+        p = Polynomial([1, 2, 3])
+        p.compile(memo_size=4)
+        self.assertEqual(p(2), 11)
+        q = pickle.loads(pickle.dumps(p))
+        self.assertEqual(q.coefficients, p.coefficients)
+        self.assertEqual(q(2), 11)
+        self.assertEqual(q.compile()(2), 11)
+
+    def test_compile_memo(self):
+        """
+        Tests the LRU memo enabled through compile(memo_size).
+
+        Asserts:
+            Repeated evaluation at the same x is served from the memo.
+            Unhashable values of x are evaluated without the memo.
+            A negative memo_size raises ValueError.
+        """
+        p = Polynomial([1, 0, -2])
+        plan = p.compile(memo_size=4)
+        self.assertEqual(p(3), 7)
+        self.assertEqual(p(3), 7)
+        self.assertEqual(plan.cache_info().hits, 1)
+
+        class UnhashableFloat(float):
+            __hash__ = None
+
+        self.assertEqual(p(UnhashableFloat(3.0)), 7.0)
+        self.assertEqual(plan.cache_info().hits, 1)
+        with self.assertRaises(ValueError):
+            p.compile(memo_size=-1)
+
+
+class TestPolynomialBatch(unittest.TestCase):
+    """
+    Unit test class for testing the PolynomialBatch class.
+
+    Methods:
+        setUp(): Initializes two batches of polynomials.
+        test_round_trip(): Tests conversion to and from lists of Polynomial.
+        test_call(): Tests evaluation of the whole batch.
+        test_addition(): Tests element-wise addition of two batches.
+        test_subtraction(): Tests element-wise subtraction of two batches.
+        test_multiplication(): Tests element-wise multiplication of two batches.
+        test_size_mismatch(): Tests that batches of different sizes are rejected.
+        test_non_batch_operand(): Tests that arithmetic with non-batch operands raises TypeError.
+        test_semantics_vs_polynomial(): Tests that the batch follows standard arithmetic, unlike Polynomial.
+    """
+
+    def setUp(self):
+        """
+        Sets up two batches of polynomials for testing.
+
+        Instances:
+            a: x^2 + 2x + 3 and 2x + 1.
+            b: 3x + 4 and x^2 - 1.
+        """
+        self.a = PolynomialBatch([[1, 2, 3], [2, 1]])
+        self.b = PolynomialBatch([[3, 4], [1, 0, -1]])
+
+    def test_round_trip(self):
+        """
+        Tests from_polynomials() and to_polynomials().
+
+        Asserts:
+            Converting a list of Polynomial instances to a batch and back keeps their coefficients.
+        """
+        polys = [Polynomial([1, 2, 3]), Polynomial([5]), Polynomial([2, 1])]
+        batch = PolynomialBatch.from_polynomials(polys)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.degree(), 2)
+        self.assertEqual([p.coefficients for p in batch.to_polynomials()],
+                         [p.coefficients for p in polys])
+
+    def test_call(self):
+        """
+        Tests the __call__() method for shared and per-polynomial x values.
+
+        Asserts:
+            a(1) returns [6, 3] and a([0, 2]) returns [3, 5].
+            Non-builtin scalars such as Fraction and Decimal are shared by the whole batch.
+        """
+        self.assertEqual(self.a(1), [6, 3])
+        self.assertEqual(self.a([0, 2]), [3, 5])
+        self.assertEqual(self.a(Fraction(1, 2)), [Fraction(17, 4), Fraction(2)])
+        self.assertEqual(self.a(Decimal('0.5')), [Decimal('4.25'), Decimal('2.0')])
+
+    def test_addition(self):
+        """
+        Tests the __add__() method for element-wise addition.
+
+        Asserts:
+            a + b yields x^2 + 5x + 7 and x^2 + 2x.
+        """
+        result = [p.coefficients for p in (self.a + self.b).to_polynomials()]
+        self.assertEqual(result, [[7, 5, 1], [0, 2, 1]])
+
+    def test_subtraction(self):
+        """
+        Tests the __sub__() method for element-wise subtraction.
+
+        Asserts:
+            a - a yields zero polynomials and a - b yields x^2 - x - 1 and -x^2 + 2x + 2.
+        """
+        zero = self.a - self.a
+        self.assertEqual(zero.degree(), 0)
+        result = [p.coefficients for p in (self.a - self.b).to_polynomials()]
+        self.assertEqual(result, [[-1, -1, 1], [2, 2, -1]])
+
+    def test_multiplication(self):
+        """
+        Tests the __mul__() method for element-wise multiplication.
+
+        Asserts:
+            a * b yields 3x^3 + 10x^2 + 17x + 12 and 2x^3 + x^2 - 2x - 1.
+        """
+        result = [p.coefficients for p in (self.a * self.b).to_polynomials()]
+        self.assertEqual(result, [[12, 17, 10, 3], [-1, -2, 1, 2]])
+
+    def test_size_mismatch(self):
+        """
+        Tests that combining batches of different sizes raises ValueError.
+
+        Asserts:
+            Adding a one-element batch to a two-element batch raises ValueError.
+        """
+        with self.assertRaises(ValueError):
+            self.a + PolynomialBatch([[1]])
+
+    def test_non_batch_operand(self):
+        """
+        Tests that +, - and * with an int return NotImplemented and so raise TypeError.
+
+        Asserts:
+            a + 1, a - 1 and a * 1 raise TypeError, and a.__add__(1) is NotImplemented.
+        """
+        self.assertIs(self.a.__add__(1), NotImplemented)
+        with self.assertRaises(TypeError):
+            self.a + 1
+        with self.assertRaises(TypeError):
+            self.a - 1
+        with self.assertRaises(TypeError):
+            self.a * 1
+
+    def test_semantics_vs_polynomial(self):
+        """
+        Tests the intended semantics: the batch follows standard polynomial arithmetic.
+
+        Asserts:
+            (x^2 + 2x + 3) + (x^2 + 5) is 2x^2 + 2x + 8 in the batch, while Polynomial.__add__
+            returns the reversed coefficients [2, 2, 8]; batch values match p(x) + q(x) and
+            p(x) * q(x); PolynomialBatch([[1, 0]]) is x while Polynomial([1, 0]) is 1.
+        """
+        p, q = Polynomial([1, 2, 3]), Polynomial([1, 0, 5])
+        a, b = PolynomialBatch.from_polynomials([p]), PolynomialBatch.from_polynomials([q])
+        self.assertEqual((a + b).to_polynomials()[0].coefficients, [8, 2, 2])
+        self.assertEqual((p + q).coefficients, [2, 2, 8])
+        for x in (0, 1, 2, -3):
+            self.assertEqual((a + b)(x), [p(x) + q(x)])
+            self.assertEqual((a - b)(x), [p(x) - q(x)])
+            self.assertEqual((a * b)(x), [p(x) * q(x)])
+        self.assertEqual(PolynomialBatch([[1, 0]])(2), [2])
+        self.assertEqual(Polynomial([1, 0])(2), 1)
+
 if __name__ == "__main__":
     unittest.main()